@@ -1,12 +1,25 @@
-from collections import namedtuple
-from PyQt5 import QtWidgets, QtGui, QtCore
+from collections import namedtuple, deque
+from contextlib import nullcontext
+import copy
+from PyQt5 import QtWidgets, QtGui, QtCore, sip
 from PyQt5.QtCore import Qt, QSettings, QPoint, QPointF
 from PyQt5.QtWidgets import QComboBox, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton
+import argparse
+import functools
+import hashlib
 import json
 import os
 import math
+import mmap
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
 from PyQt5.QtWidgets import QSystemTrayIcon, QMenu, QAction
 
+__version__ = '1.4'
 
 def get_app_icon() -> QtGui.QIcon:
     """
@@ -29,6 +42,100 @@ def get_app_icon() -> QtGui.QIcon:
         print("Warning: Icon file not found in any location")
         return None
 
+class Tracer:
+    """
+    Opt-in span tracer for the startup and apply pipeline. Spans are timed with a
+    monotonic clock, kept in a fixed-size ring buffer and exported as Chrome
+    trace-event JSON (chrome://tracing, ui.perfetto.dev). When disabled, span()
+    hands back a shared no-op context so instrumented code pays nothing.
+    """
+    _NULL_SPAN = nullcontext()
+
+    def __init__(self, capacity: int = 20000):
+        self.enabled = False
+        self.events = deque(maxlen=capacity)
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return self._NULL_SPAN
+        return _TraceSpan(self, name, args)
+
+    def clear(self):
+        self.events.clear()
+
+    def export(self, path: str):
+        """Writes the buffered spans as trace-event JSON"""
+        with open(path, "w") as f:
+            json.dump({'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}, f)
+
+
+class _TraceSpan:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self.tracer.events.append({
+            'name': self.name,
+            'ph': 'X',  # Complete event
+            'ts': self.start / 1000,
+            'dur': (end - self.start) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': self.args,
+        })
+        return False
+
+
+# Global tracer, switchable from the tray menu or with CROSSGEN_TRACE=1
+tracer = Tracer()
+tracer.enabled = os.environ.get('CROSSGEN_TRACE', '') not in ('', '0')
+
+
+class SessionRecorder:
+    """
+    Records a settings session for headless replay. The file is JSON lines: a header
+    with the starting settings, then one compact [seconds, kind, target, value] entry
+    per control change, monitor or resolution change, color pick, apply, layer edit
+    and preset load/save.
+    """
+    def __init__(self):
+        self.file = None
+        self.start_time = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self.file is not None
+
+    def start(self, path: str, settings: dict):
+        self.stop()
+        self.file = open(path, "w", buffering=1)  # Line buffered so a crash keeps the session
+        self.file.write(json.dumps({'crossgen': __version__, 'settings': settings}) + "\n")
+        self.start_time = time.monotonic()
+
+    def record(self, kind: str, target=None, value=None):
+        if self.file is None:
+            return
+        timestamp = round(time.monotonic() - self.start_time, 3)
+        self.file.write(json.dumps([timestamp, kind, target, value], separators=(',', ':')) + "\n")
+
+    def stop(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+# Global session recorder, switchable from the tray menu or with CROSSGEN_RECORD=<file>
+recorder = SessionRecorder()
+
 # Named tuple to store dimension calculations
 Dimensions = namedtuple("Dimensions", ["size", "center", "gap", "size_f", "center_f", "gap_f", "dot_size"])
 
@@ -43,13 +150,31 @@ class SystemTray(QSystemTrayIcon):
     def setup_menu(self):
         menu = QMenu()
         restore_action = QAction("Restore", self)
+        trace_action = QAction("Trace Apply Pipeline", self)
+        export_trace_action = QAction("Export Trace...", self)
+        self.record_action = QAction("Record Session...", self)
+        clear_cache_action = QAction("Clear Render Cache", self)
         exit_action = QAction("Exit", self)
         
+        trace_action.setCheckable(True)
+        trace_action.setChecked(tracer.enabled)
+        self.record_action.setCheckable(True)
+        self.record_action.setChecked(recorder.active)
+        
         restore_action.triggered.connect(self.restore_window)
+        trace_action.toggled.connect(self.toggle_tracing)
+        export_trace_action.triggered.connect(self.export_trace)
+        self.record_action.toggled.connect(self.toggle_recording)
+        clear_cache_action.triggered.connect(sprite_cache.clear)
         exit_action.triggered.connect(self.exit_app)
         
         menu.addAction(restore_action)
         menu.addSeparator()
+        menu.addAction(trace_action)
+        menu.addAction(export_trace_action)
+        menu.addAction(self.record_action)
+        menu.addAction(clear_cache_action)
+        menu.addSeparator()
         menu.addAction(exit_action)
         
         self.setContextMenu(menu)
@@ -63,28 +188,118 @@ class SystemTray(QSystemTrayIcon):
             self.parent.show()
             self.parent.activateWindow()
 
+    def toggle_tracing(self, enabled):
+        tracer.enabled = enabled
+
+    def export_trace(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self.parent, "Export Trace", "crossgen-trace.json", "Trace Files (*.json)")
+        if not path:
+            return
+        try:
+            tracer.export(path)
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self.parent, "Error", f"Failed to export trace: {str(e)}")
+
+    def toggle_recording(self, enabled):
+        if not enabled:
+            recorder.stop()
+            return
+        if recorder.active:
+            return  # Already started from CROSSGEN_RECORD
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self.parent, "Record Session", "crossgen-session.jsonl", "Session Files (*.jsonl)")
+        if not path:
+            self.record_action.setChecked(False)
+            return
+        try:
+            recorder.start(path, self.parent.settings)
+        except Exception as e:
+            self.record_action.setChecked(False)
+            QtWidgets.QMessageBox.warning(self.parent, "Error", f"Failed to start recording: {str(e)}")
+
     def exit_app(self):
         QtWidgets.QApplication.quit()
 
-class CrosshairCanvas(QtWidgets.QWidget):
-    def __init__(self, settings):
-        super().__init__()
-        self.settings = settings.copy()  # Create a copy of settings
-        self.initUI()
+# Settings keys that describe the look of a single reticle layer
+LAYER_KEYS = (
+    'shape', 'size', 'thickness', 'gap', 'color', 'opacity', 'fill_style', 'crosshair_angle',
+    'outline_enabled', 'outline_color', 'outline_opacity', 'outline_thickness',
+    'dot_enabled', 'dot_size',
+    'subtension', 'tick_spacing', 'tick_length', 'major_tick_length', 'mil_dots',
+)
 
-    def initUI(self):
-        # Compute dimensions to set the fixed size of the widget
-        dims = self._compute_dimensions()
-        self.setFixedSize(dims.size, dims.size)
-        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setMouseTracking(False)
+# Procedural ranging shapes, drawn from precomputed geometry
+RANGING_SHAPES = ('Mil-Dot', 'Tick Scale')
 
-        # Position window at screen center
-        screen = QtWidgets.QApplication.primaryScreen().geometry()
-        center_x = int(screen.center().x() - dims.size // 2)
-        center_y = int(screen.center().y() - dims.size // 2)
-        self.move(center_x, center_y)
+
+@functools.lru_cache(maxsize=64)
+def ranging_geometry(shape: str, size: int, gap: int, subtension: float, tick_spacing: float,
+                     tick_length: float, major_tick_length: float, mil_dots: int):
+    """
+    Builds the geometry of a ranging reticle centered on the origin: a tuple of
+    (x1, y1, x2, y2) lines for the arms and hash marks, and a tuple of (x, y, radius)
+    mil-dots. Distances are in mils scaled by subtension (pixels per mil). The result
+    is cached and shared across render threads, so it is kept free of Qt objects.
+    """
+    half = size / 2
+    arms = ((0.0, -1.0), (0.0, 1.0), (-1.0, 0.0), (1.0, 0.0))
+    lines = [(dx * gap, dy * gap, dx * half, dy * half) for dx, dy in arms]
+    dots = []
+
+    if shape == 'Tick Scale':
+        # Ticks every tick_spacing mils, full-mil ticks drawn longer
+        step = tick_spacing * subtension
+        count = int(half / step + 1e-9) if step > 0 else 0
+        for dx, dy in arms:
+            for k in range(1, count + 1):
+                distance = k * step
+                if distance <= gap:
+                    continue
+                mils = k * tick_spacing
+                length = major_tick_length if abs(mils - round(mils)) < 1e-6 else tick_length
+                x, y = dx * distance, dy * distance
+                # Perpendicular to the arm
+                lines.append((x - dy * length / 2, y - dx * length / 2,
+                              x + dy * length / 2, y + dx * length / 2))
+    elif shape == 'Mil-Dot':
+        # Dots one mil apart, each a quarter mil across
+        radius = max(0.5, subtension / 8)
+        for dx, dy in arms:
+            for k in range(1, mil_dots + 1):
+                distance = k * subtension
+                if gap < distance <= half:
+                    dots.append((dx * distance, dy * distance, radius))
+
+    return tuple(lines), tuple(dots)
+
+
+_ranging_paths = threading.local()
+
+
+def ranging_paths(*geometry):
+    """
+    The ranging_geometry(*geometry) lines as a QLineF list and the dots as one
+    QPainterPath, built once per thread and reused by every later paint
+    """
+    paths = getattr(_ranging_paths, 'cache', None)
+    if paths is None:
+        paths = _ranging_paths.cache = {}
+    if geometry not in paths:
+        if len(paths) >= 64:
+            del paths[next(iter(paths))]  # Oldest first
+        lines, dots = ranging_geometry(*geometry)
+        path = QtGui.QPainterPath()
+        for x, y, radius in dots:
+            path.addEllipse(QPointF(x, y), radius, radius)
+        paths[geometry] = [QtCore.QLineF(*line) for line in lines], path
+    return paths[geometry]
+
+
+class Reticle:
+    """Draws a single reticle shape described by a settings dict"""
+    def __init__(self, settings):
+        self.settings = settings
 
     def _compute_dimensions(self) -> Dimensions:
         """
@@ -126,8 +341,7 @@ class CrosshairCanvas(QtWidgets.QWidget):
         pen.setJoinStyle(Qt.RoundJoin)
         return pen
 
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
+    def paint(self, painter):
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
 
         dims = self._compute_dimensions()
@@ -141,7 +355,6 @@ class CrosshairCanvas(QtWidgets.QWidget):
         # Then draw main shape
         painter.setOpacity(self.settings.get('opacity', 100) / 100)
         self._draw_shape(painter, shape, dims, False)
-        painter.end()
 
     def _draw_shape(self, painter, shape: str, dims: Dimensions, is_outline: bool):
         if shape == 'Crosshair':
@@ -154,6 +367,8 @@ class CrosshairCanvas(QtWidgets.QWidget):
             self._draw_x_shape(painter, dims, is_outline)
         elif shape == 'Diamond':
             self._draw_diamond(painter, dims, is_outline)
+        elif shape in RANGING_SHAPES:
+            self._draw_ranging(painter, shape, dims, is_outline)
 
     def _draw_crosshair(self, painter, dims: Dimensions, is_outline: bool):
         pen = self.create_pen(is_outline, 'Crosshair')
@@ -212,7 +427,7 @@ class CrosshairCanvas(QtWidgets.QWidget):
         else:
             fill_style = self.settings.get('fill_style', 'Ring')
             if fill_style == 'Full':
-                painter.setBrush(QtGui.QBrush(QtGui.QColor(self.settings['color'])))
+                painter.setBrush(QtGui.QBrush(QtGui.QColor(self.settings.get('color', '#FF0000'))))
             else:
                 painter.setBrush(Qt.NoBrush)
             painter.drawEllipse(center_point, radius, radius)
@@ -354,8 +569,742 @@ class CrosshairCanvas(QtWidgets.QWidget):
                     QPointF(dims.center_f, dims.center_f),
                     dot_size / 2, dot_size / 2
                 )
-                
-                    
+
+
+    def _draw_ranging(self, painter, shape: str, dims: Dimensions, is_outline: bool):
+        pen = self.create_pen(is_outline, shape)
+        painter.setPen(pen)
+
+        lines, dots = ranging_paths(
+            shape, dims.size, dims.gap,
+            self.settings.get('subtension', 10),
+            self.settings.get('tick_spacing', 0.5),
+            self.settings.get('tick_length', 4),
+            self.settings.get('major_tick_length', 8),
+            self.settings.get('mil_dots', 4),
+        )
+
+        painter.save()
+        painter.translate(dims.center_f, dims.center_f)
+        painter.rotate(self.settings.get('crosshair_angle', 0))
+
+        # One call for every line, one for every dot
+        painter.drawLines(lines)
+        if not dots.isEmpty():
+            painter.setBrush(pen.color())
+            painter.drawPath(dots)
+        painter.restore()
+
+        if not is_outline and self.settings.get('dot_enabled', True):
+            dot_size = self.settings.get('dot_size', 2)
+            if dot_size == 1:
+                painter.drawPoint(QPointF(dims.center_f, dims.center_f))
+            else:
+                painter.drawEllipse(
+                    QPointF(dims.center_f, dims.center_f),
+                    dot_size / 2, dot_size / 2
+                )
+
+
+class ReticleRenderer:
+    """
+    Composites the layers of a reticle into a single offscreen sprite.
+    Each layer is rasterized into its own image, cached by its normalized spec,
+    so only layers whose spec changed are re-rendered on the next composite.
+    """
+    def __init__(self):
+        self._layer_cache = {}
+
+    @staticmethod
+    def layer_specs(settings) -> list:
+        """
+        Returns the ordered layer specs to draw, bottom first. Stored layers inherit
+        any key they omit from the main settings, which are drawn as the top layer.
+        """
+        base = {key: settings[key] for key in LAYER_KEYS if key in settings}
+        return [dict(base, **layer) for layer in settings.get('layers', [])] + [base]
+
+    @staticmethod
+    def spec_key(spec: dict, dpr: float = 1.0) -> str:
+        return json.dumps(spec, sort_keys=True) + f"@{dpr:g}"
+
+    def sprite_size(self, settings) -> int:
+        return max(Reticle(spec)._compute_dimensions().size for spec in self.layer_specs(settings))
+
+    def render_layer(self, spec: dict, dpr: float = 1.0) -> QtGui.QImage:
+        size = Reticle(spec)._compute_dimensions().size
+        image = QtGui.QImage(math.ceil(size * dpr), math.ceil(size * dpr), QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.transparent)
+        painter = QtGui.QPainter(image)
+        Reticle(spec).paint(painter)
+        painter.end()
+        return image
+
+    def render(self, settings, dpr: float = 1.0) -> QtGui.QImage:
+        size = self.sprite_size(settings)
+        sprite = QtGui.QImage(math.ceil(size * dpr), math.ceil(size * dpr), QtGui.QImage.Format_ARGB32_Premultiplied)
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.transparent)
+
+        painter = QtGui.QPainter(sprite)
+        layer_cache = {}
+        for spec in self.layer_specs(settings):
+            key = self.spec_key(spec, dpr)
+            layer = layer_cache.get(key, self._layer_cache.get(key))
+            if layer is None:
+                layer = self.render_layer(spec, dpr)
+            layer_cache[key] = layer
+            # Layers of different sizes share the sprite center
+            offset = (size - layer.width() / dpr) / 2
+            painter.drawImage(QPointF(offset, offset), layer)
+        painter.end()
+
+        # Keep only the layers still in use
+        self._layer_cache = layer_cache
+        return sprite
+
+
+class SpriteCache:
+    """
+    Persistent on-disk cache of rendered sprites, so the overlay can appear at launch
+    without rasterizing. Entries are keyed by the normalized layer specs, DPR and the
+    Qt/crossgen versions. Each file holds raw pixels followed by a checksummed trailer
+    and is loaded through a read-only memory map straight into a QImage. The directory
+    is capped in size, evicting the least recently used entries by mtime.
+
+    A plain load() copies the pixels out and unmaps the file at once. load(pin=True)
+    hands out the QImage over the mapping itself and keeps the entry pinned until
+    release(); only the launch overlay does this, and only until its first paint.
+    """
+    MAGIC = b'CGSP'
+    TRAILER = struct.Struct('<4sIIIIdI')  # magic, width, height, bytes per line, format, dpr, crc32 of all before it
+
+    def __init__(self, cache_dir=None, max_bytes=32 * 1024 * 1024):
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), ".crossgen", "sprites")
+        self.max_bytes = max_bytes
+        # key -> [mapping, pin count] for QImages handed out over their mapping
+        self._pinned = {}
+        # Pinned entries dropped by clear(); deleted once their last pin is released
+        self._cleared = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(settings, dpr: float) -> str:
+        specs = ReticleRenderer.layer_specs(settings)
+        blob = json.dumps([specs, f"{dpr:g}", QtCore.QT_VERSION_STR, __version__], sort_keys=True)
+        return hashlib.sha1(blob.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.sprite")
+
+    def load(self, settings, dpr: float = 1.0, pin: bool = False):
+        """
+        Returns the cached sprite, or None on a miss. With pin=True the QImage reads the
+        mapped file directly and the caller must release() the key once it is done with it.
+        Pinned sprites keep a device pixel ratio of 1, as setting it would copy the
+        read-only pixels; callers draw them at the dpr they asked for.
+        """
+        key = self.key(settings, dpr)
+        with self._lock:
+            if key in self._cleared:
+                return None
+            if pin and key in self._pinned:
+                mapping = self._pinned[key][0]
+                self._pinned[key][1] += 1
+            else:
+                mapping = self._map(key)
+                if mapping is None:
+                    return None
+                if pin:
+                    self._pinned[key] = [mapping, 1]
+
+        _, width, height, bytes_per_line, image_format, sprite_dpr, _ = self.TRAILER.unpack_from(
+            mapping, len(mapping) - self.TRAILER.size)
+        sprite = QtGui.QImage(sip.voidptr(mapping), width, height, bytes_per_line, QtGui.QImage.Format(image_format))
+        if not pin:
+            sprite = sprite.copy()
+            mapping.close()
+            sprite.setDevicePixelRatio(sprite_dpr)
+        try:
+            os.utime(self.path(key))  # Mark as recently used
+        except OSError:
+            pass
+        return sprite
+
+    def release(self, key: str):
+        """Drops one pin taken by load(pin=True), unmapping the file with the last one"""
+        with self._lock:
+            table = self._pinned if key in self._pinned else self._cleared
+            entry = table.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del table[key]
+            entry[0].close()
+            if table is self._cleared:
+                try:
+                    os.remove(self.path(key))
+                except OSError:
+                    pass
+
+    def _map(self, key: str):
+        try:
+            with open(self.path(key), 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None  # Missing or empty
+
+        if self._valid(mapping):
+            return mapping
+        mapping.close()
+        print(f"Warning: Discarding corrupt render cache entry {key}")
+        try:
+            os.remove(self.path(key))
+        except OSError:
+            pass
+        return None
+
+    def _valid(self, mapping) -> bool:
+        if len(mapping) < self.TRAILER.size:
+            return False
+        magic, width, height, bytes_per_line, image_format, dpr, crc = self.TRAILER.unpack_from(
+            mapping, len(mapping) - self.TRAILER.size)
+        pixel_bytes = bytes_per_line * height
+        if magic != self.MAGIC or bytes_per_line < width * 4 or pixel_bytes + self.TRAILER.size != len(mapping):
+            return False
+        if image_format != QtGui.QImage.Format_ARGB32_Premultiplied or not 0 < dpr < math.inf:
+            return False
+        with memoryview(mapping) as view, view[:pixel_bytes] as pixels, view[pixel_bytes:-4] as header:
+            return zlib.crc32(header, zlib.crc32(pixels)) == crc
+
+    def store(self, settings, dpr: float, sprite: QtGui.QImage):
+        sprite = sprite.convertToFormat(QtGui.QImage.Format_ARGB32_Premultiplied)
+        bits = sprite.constBits()
+        pixels = bits.asstring(sprite.bytesPerLine() * sprite.height())
+        header = self.TRAILER.pack(
+            self.MAGIC, sprite.width(), sprite.height(), sprite.bytesPerLine(),
+            int(sprite.format()), sprite.devicePixelRatio(), 0)[:-4]
+        trailer = header + struct.pack('<I', zlib.crc32(header, zlib.crc32(pixels)))
+
+        path = self.path(self.key(settings, dpr))
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(pixels)
+                f.write(trailer)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Warning: Failed to write render cache entry: {e}")
+            return
+        self.evict()
+
+    def _entries(self):
+        """Cache files that can be removed, i.e. all but the pinned ones"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        with self._lock:
+            pinned = {f"{key}.sprite" for key in (*self._pinned, *self._cleared)}
+        entries = []
+        for name in names:
+            if name.endswith('.sprite') and name not in pinned:
+                try:
+                    entries.append((os.path.join(self.cache_dir, name), os.stat(os.path.join(self.cache_dir, name))))
+                except OSError:
+                    pass
+        return entries
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits its size cap"""
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= stat.st_size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Removes every entry; pinned ones are dropped now and deleted on their last release"""
+        with self._lock:
+            self._cleared.update(self._pinned)
+            self._pinned.clear()
+        for path, _ in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+# Global render cache, shared by the overlay worker and startup
+sprite_cache = SpriteCache()
+
+
+class _RenderSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(int, object, object)
+    failed = QtCore.pyqtSignal(int, str)
+
+
+class RenderJob(QtCore.QRunnable):
+    def __init__(self, worker, generation, settings, dpr):
+        super().__init__()
+        self.worker = worker
+        self.signals = worker.signals
+        self.renderer = worker.renderer
+        self.generation = generation
+        self.settings = settings
+        self.dpr = dpr
+
+    def run(self):
+        # Superseded while still queued
+        if self.generation != self.worker.generation:
+            return
+        try:
+            frame = self.worker.renderFrame(self.settings, self.dpr)
+        except Exception as e:
+            import traceback
+            self.signals.failed.emit(self.generation, f'{str(e)}\n{traceback.format_exc()}')
+            return
+        self.signals.finished.emit(self.generation, frame, self.settings)
+
+
+class RenderWorker(QtCore.QObject):
+    """
+    Rasterizes reticle frames into QImages on a single background thread so heavy
+    reticles never stall the GUI thread. Only the newest request matters: queued
+    jobs are dropped when a newer one arrives, and frames finished after being
+    superseded are discarded. Callers keep showing their last good frame until
+    frameReady delivers the new one.
+    """
+    frameReady = QtCore.pyqtSignal(object, object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, renderer=None, parent=None, cache=None, span_name='render'):
+        super().__init__(parent)
+        self.renderer = renderer or ReticleRenderer()  # Only touched from the worker thread
+        self.cache = cache
+        self.span_name = span_name  # Keeps each worker's rasterizations apart in traces
+        self.generation = 0
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.signals = _RenderSignals()  # Parentless so in-flight jobs never emit into a deleted object
+        self.signals.finished.connect(self.onFinished)
+        self.signals.failed.connect(self.onFailed)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.shutdown)
+
+    def request(self, settings, dpr: float = 1.0):
+        self.generation += 1
+        self.pool.clear()
+        self.pool.start(RenderJob(self, self.generation, copy.deepcopy(settings), dpr))
+
+    def renderFrame(self, settings, dpr):
+        """Runs on the worker thread: the sprite for settings, from the cache when possible"""
+        sprite = self.cache.load(settings, dpr) if self.cache else None
+        if sprite is None:
+            with tracer.span(self.span_name, generation=self.generation):
+                sprite = self.renderer.render(settings, dpr)
+            if self.cache:
+                self.cache.store(settings, dpr, sprite)
+        return sprite
+
+    def onFinished(self, generation, sprite, settings):
+        if generation == self.generation:
+            self.frameReady.emit(sprite, settings)
+
+    def onFailed(self, generation, message):
+        if generation == self.generation:
+            self.failed.emit(message)
+
+    def shutdown(self):
+        self.generation += 1
+        self.pool.clear()
+        self.pool.waitForDone()
+
+
+class MarkerRenderWorker(RenderWorker):
+    """RenderWorker for a batch of marker sprites; requests take {key: spec} and frames are {key: QImage}"""
+    def renderFrame(self, specs, dpr):
+        return {key: super(MarkerRenderWorker, self).renderFrame(spec, dpr) for key, spec in specs.items()}
+
+
+class CrosshairCanvas(QtWidgets.QWidget):
+    def __init__(self, settings, renderer=None, sprite=None, dpr=None):
+        super().__init__()
+        self.settings = settings.copy()  # Create a copy of settings
+        self.renderer = renderer or ReticleRenderer()
+        self.sprite = sprite  # Pre-rendered by a RenderWorker, otherwise rendered on first paint
+        # Given for pinned cache sprites, which carry no device pixel ratio of their own
+        self.dpr = dpr or (sprite.devicePixelRatio() if sprite is not None else 1.0)
+        self.pinned = None  # (cache, key) while the sprite still reads a pinned cache file
+        with tracer.span('CrosshairCanvas.initUI'):
+            self.initUI()
+
+    def initUI(self):
+        # The sprite size fits the largest layer
+        if self.sprite is not None:
+            size = round(self.sprite.width() / self.dpr)
+        else:
+            size = self.renderer.sprite_size(self.settings)
+        self.setFixedSize(size, size)
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setMouseTracking(False)
+
+        # Position window at screen center
+        screen = QtWidgets.QApplication.primaryScreen().geometry()
+        center_x = int(screen.center().x() - size // 2)
+        center_y = int(screen.center().y() - size // 2)
+        self.move(center_x, center_y)
+
+    def paintEvent(self, event):
+        with tracer.span('paintEvent', first=self.sprite is None):
+            # All layers are composited once into a cached sprite
+            if self.sprite is None:
+                with tracer.span('render'):
+                    self.sprite = self.renderer.render(self.settings, self.devicePixelRatioF())
+                self.dpr = self.sprite.devicePixelRatio()
+            painter = QtGui.QPainter(self)
+            painter.drawImage(QtCore.QRectF(0, 0, self.sprite.width() / self.dpr, self.sprite.height() / self.dpr),
+                              self.sprite)
+            painter.end()
+        self.detachSprite()
+
+    def detachSprite(self):
+        """Copies a sprite still backed by the render cache so its file can be unpinned"""
+        if self.pinned is None:
+            return
+        cache, key = self.pinned
+        self.pinned = None
+        self.sprite = self.sprite.copy()
+        cache.release(key)
+
+    def closeEvent(self, event):
+        self.detachSprite()
+        super().closeEvent(event)
+
+
+class MarkerOverlay(QtWidgets.QWidget):
+    """
+    Full-screen, input-transparent canvas drawing many reticle instances in one paint.
+    Markers are dicts with 'x'/'y' screen offsets plus optional spec overrides. Markers
+    sharing a spec share one cached sprite and are blitted in a single
+    drawPixmapFragments call, and moving a marker only repaints its old and new rects.
+    Markers without overrides reuse the overlay's finished frame; other sprites come
+    from a MarkerRenderWorker, and their markers appear once they land.
+    """
+    def __init__(self, cache=None):
+        super().__init__()
+        self.worker = MarkerRenderWorker(parent=self, cache=cache, span_name='marker render')
+        self.worker.frameReady.connect(self.addSprites)
+        self.markers = []
+        self.keys = []       # sprite key per marker
+        self.sprites = {}    # sprite key -> QPixmap
+        self.fragments = {}  # sprite key -> fragments blitted from that sprite
+        self.instances = []  # (sprite key, index into its fragment list), None while its sprite renders
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool | Qt.WindowTransparentForInput)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+
+    def fragment(self, key, x, y) -> QtGui.QPainter.PixmapFragment:
+        pixmap = self.sprites[key]
+        scale = 1 / self.devicePixelRatioF()
+        return QtGui.QPainter.PixmapFragment.create(
+            QPointF(x, y), QtCore.QRectF(0, 0, pixmap.width(), pixmap.height()), scale, scale)
+
+    def fragmentRect(self, key, index) -> QtCore.QRect:
+        fragment = self.fragments[key][index]
+        pixmap = self.sprites[key]
+        half_w = pixmap.width() * fragment.scaleX / 2
+        half_h = pixmap.height() * fragment.scaleY / 2
+        rect = QtCore.QRectF(fragment.x - half_w, fragment.y - half_h, half_w * 2, half_h * 2)
+        return rect.toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def setMarkers(self, markers, settings, sprite=None, sprite_dpr=None):
+        """
+        sprite is the overlay's finished frame for settings, if there is one, and
+        sprite_dpr its device pixel ratio when the image does not carry it
+        """
+        base = {key: value for key, value in settings.items() if key != 'markers'}
+        dpr = self.devicePixelRatioF()
+        sprites = {}
+        missing = {}
+        self.markers = list(markers)
+        self.keys = []
+        for marker in self.markers:
+            overrides = {key: value for key, value in marker.items() if key not in ('x', 'y')}
+            spec = dict(base, **overrides)
+            key = SpriteCache.key(spec, dpr)
+            self.keys.append(key)
+            if key in sprites:
+                continue
+            if key in self.sprites:
+                sprites[key] = self.sprites[key]
+            elif not overrides and sprite is not None and (sprite_dpr or sprite.devicePixelRatio()) == dpr:
+                # Copied, as the frame may still read a pinned cache file
+                frame = sprite.copy()
+                frame.setDevicePixelRatio(dpr)
+                sprites[key] = QtGui.QPixmap.fromImage(frame)
+            else:
+                missing[key] = spec
+        self.sprites = sprites  # Drop sprites no marker uses any more
+        if missing:
+            self.worker.request(missing, dpr)
+        self.layoutMarkers()
+
+    def addSprites(self, frame, specs):
+        for key, sprite in frame.items():
+            if key in self.keys and key not in self.sprites:
+                self.sprites[key] = QtGui.QPixmap.fromImage(sprite)
+        self.layoutMarkers()
+
+    def layoutMarkers(self):
+        self.fragments = {}
+        self.instances = []
+        for marker, key in zip(self.markers, self.keys):
+            if key not in self.sprites:
+                self.instances.append(None)
+                continue
+            group = self.fragments.setdefault(key, [])
+            self.instances.append((key, len(group)))
+            group.append(self.fragment(key, marker['x'], marker['y']))
+        self.update()
+
+    def moveMarker(self, index, x, y):
+        self.markers[index] = dict(self.markers[index], x=x, y=y)
+        if self.instances[index] is None:
+            return  # Laid out at its new position once its sprite lands
+        key, position = self.instances[index]
+        dirty = QtGui.QRegion(self.fragmentRect(key, position))
+        self.fragments[key][position] = self.fragment(key, x, y)
+        self.update(dirty.united(self.fragmentRect(key, position)))
+
+    def paintEvent(self, event):
+        with tracer.span('markers paintEvent', markers=len(self.instances)):
+            painter = QtGui.QPainter(self)
+            for key, fragments in self.fragments.items():
+                painter.drawPixmapFragments(fragments, self.sprites[key])
+            painter.end()
+
+
+class ReticlePreview(QtWidgets.QWidget):
+    """
+    Offscreen preview of the reticle, drawn through the same ReticleRenderer as
+    CrosshairCanvas. Shows the sprite at 1x next to a magnified copy with a pixel grid.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.worker = RenderWorker(parent=self, span_name='preview render')
+        self.worker.frameReady.connect(self.setSprite)
+        self.sprite = None
+        self.zoom = 4
+        self.setFixedHeight(110)
+
+    def setSettings(self, settings):
+        self.worker.request(settings, self.devicePixelRatioF())
+
+    def setSprite(self, sprite, settings=None):
+        self.sprite = sprite
+        self.update()
+
+    def setZoom(self, zoom):
+        self.zoom = zoom
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtGui.QColor('#808080'))
+        if self.sprite is None:
+            painter.end()
+            return
+
+        dpr = self.sprite.devicePixelRatio()
+        sprite_w = self.sprite.width() / dpr
+        sprite_h = self.sprite.height() / dpr
+
+        # 1x view in a square on the left, cropped around the center for large sprites
+        actual_rect = QtCore.QRectF(0, 0, self.height(), self.height())
+        painter.setClipRect(actual_rect)
+        painter.drawImage(QPointF(actual_rect.center().x() - sprite_w / 2,
+                                  actual_rect.center().y() - sprite_h / 2), self.sprite)
+
+        # Magnified view, one sprite pixel per zoom x zoom block, cropped around the center
+        zoom_rect = QtCore.QRectF(self.height(), 0, self.width() - self.height(), self.height())
+        pixel = self.zoom / dpr
+        target = QtCore.QRectF(0, 0, self.sprite.width() * pixel, self.sprite.height() * pixel)
+        target.moveCenter(zoom_rect.center())
+        painter.setClipRect(zoom_rect)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, False)
+        painter.drawImage(target, self.sprite)
+
+        # Pixel grid, only once the blocks are big enough to tell apart
+        if pixel >= 4:
+            painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0, 60), 0))
+            x = target.left()
+            while x <= target.right():
+                painter.drawLine(QPointF(x, zoom_rect.top()), QPointF(x, zoom_rect.bottom()))
+                x += pixel
+            y = target.top()
+            while y <= target.bottom():
+                painter.drawLine(QPointF(zoom_rect.left(), y), QPointF(zoom_rect.right(), y))
+                y += pixel
+        painter.end()
+
+
+THUMBNAIL_SIZE = 64
+
+
+def render_thumbnail(settings, size: int = THUMBNAIL_SIZE) -> QtGui.QImage:
+    """
+    Renders a preset scaled to fit a size x size thumbnail. Scaling is done through
+    the device pixel ratio so the reticle is drawn crisply rather than resampled.
+    Safe to call off the GUI thread.
+    """
+    renderer = ReticleRenderer()
+    scale = size / renderer.sprite_size(settings)
+    sprite = renderer.render(settings, scale)
+    sprite.setDevicePixelRatio(1.0)
+    return sprite
+
+
+class ThumbnailSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(str, QtGui.QImage)
+
+
+class ThumbnailJob(QtCore.QRunnable):
+    """Loads or renders one preset thumbnail on a pool thread, cached on disk by content hash"""
+    def __init__(self, preset_path, cache_dir, signals):
+        super().__init__()
+        self.preset_path = preset_path
+        self.cache_dir = cache_dir
+        self.signals = signals
+
+    def run(self):
+        image = QtGui.QImage()
+        try:
+            with open(self.preset_path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha1(f"{__version__}:{THUMBNAIL_SIZE}:".encode() + data).hexdigest()
+            cache_path = os.path.join(self.cache_dir, f"{digest}.png")
+            if not image.load(cache_path):
+                image = render_thumbnail(json.loads(data))
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+                image.save(temp_path, 'PNG')
+                os.replace(temp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Failed to render thumbnail for {self.preset_path}: {e}")
+        self.signals.finished.emit(self.preset_path, image)
+
+
+class PresetGalleryModel(QtCore.QAbstractListModel):
+    """
+    Lists presets by name and fetches thumbnails lazily. The view only asks for
+    decorations of visible items, and each request gets a higher pool priority
+    than the last, so whatever is on screen after a scroll is rendered first.
+    """
+    def __init__(self, presets_dir, names, parent=None):
+        super().__init__(parent)
+        self.presets_dir = presets_dir
+        self.names = names
+        self.rows = {self.presetPath(name): row for row, name in enumerate(names)}
+        self.cache_dir = os.path.join(os.path.expanduser("~"), ".crossgen", "thumbnails")
+        self.thumbnails = {}
+        self.pending = set()
+        self.priority = 0
+        self.pool = QtCore.QThreadPool(self)
+        self.signals = ThumbnailSignals()  # Parentless so in-flight jobs never emit into a deleted object
+        self.signals.finished.connect(self.onThumbnailReady)
+        self.placeholder = QtGui.QPixmap(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+        self.placeholder.fill(Qt.transparent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self.names[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.DecorationRole:
+            path = self.presetPath(name)
+            if path in self.thumbnails:
+                return self.thumbnails[path]
+            if path not in self.pending:
+                self.pending.add(path)
+                self.priority += 1
+                self.pool.start(ThumbnailJob(path, self.cache_dir, self.signals), self.priority)
+            return self.placeholder
+        return None
+
+    def presetPath(self, name):
+        return os.path.join(self.presets_dir, f"{name}.json")
+
+    def onThumbnailReady(self, path, image):
+        self.pending.discard(path)
+        self.thumbnails[path] = QtGui.QPixmap.fromImage(image) if not image.isNull() else self.placeholder
+        index = self.index(self.rows[path])
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def shutdown(self):
+        """Drops queued jobs and waits for the ones already running"""
+        self.pool.clear()
+        self.pool.waitForDone()
+
+
+class PresetGalleryDialog(QDialog):
+    def __init__(self, presets_dir, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Load Preset")
+        self.resize(520, 420)
+        layout = QVBoxLayout()
+
+        # Only file names are read here; presets are parsed on the pool
+        names = sorted(f[:-len(".json")] for f in os.listdir(presets_dir) if f.endswith(".json"))
+        self.model = PresetGalleryModel(presets_dir, names, self)
+
+        self.view = QtWidgets.QListView()
+        self.view.setViewMode(QtWidgets.QListView.IconMode)
+        self.view.setResizeMode(QtWidgets.QListView.Adjust)
+        self.view.setMovement(QtWidgets.QListView.Static)
+        self.view.setIconSize(QtCore.QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.view.setGridSize(QtCore.QSize(THUMBNAIL_SIZE + 32, THUMBNAIL_SIZE + 32))
+        self.view.setUniformItemSizes(True)
+        self.view.setLayoutMode(QtWidgets.QListView.Batched)
+        self.view.setModel(self.model)
+        self.view.doubleClicked.connect(self.accept)
+        if names:
+            self.view.setCurrentIndex(self.model.index(0))
+        layout.addWidget(self.view)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        ok_button = QPushButton("OK")
+        cancel_button = QPushButton("Cancel")
+        ok_button.clicked.connect(self.accept)
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(ok_button)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+    def selectedPreset(self):
+        index = self.view.currentIndex()
+        return self.model.names[index.row()] if index.isValid() else None
+
+    def done(self, result):
+        self.model.shutdown()
+        super().done(result)
+
 
 class CustomResolutionDialog(QDialog):
     def __init__(self, parent=None):
@@ -386,11 +1335,30 @@ class CustomResolutionDialog(QDialog):
         self.setLayout(layout)
 
 class AdvancedSettingsWindow(QtWidgets.QWidget):
+    # Controls that feed the preview, with the signal each reports its changes on
+    PREVIEW_CONTROLS = (
+        ('shape_combo', 'currentTextChanged'), ('fill_style_combo', 'currentTextChanged'),
+        ('size_spin', 'valueChanged'), ('thickness_spin', 'valueChanged'), ('gap_spin', 'valueChanged'),
+        ('opacity_slider', 'valueChanged'), ('outline_check', 'stateChanged'),
+        ('outline_opacity_slider', 'valueChanged'), ('outline_thickness_spin', 'valueChanged'),
+        ('dot_enabled', 'stateChanged'), ('dot_size_spin', 'valueChanged'), ('angle_spin', 'valueChanged'),
+        ('subtension_spin', 'valueChanged'), ('tick_spacing_spin', 'valueChanged'),
+        ('tick_length_spin', 'valueChanged'), ('major_tick_length_spin', 'valueChanged'),
+        ('mil_dots_spin', 'valueChanged'),
+    )
+
     def __init__(self):
         super().__init__()
         self.crosshair = None
-        self.settings = self.loadSettings()
+        self.marker_overlay = None
+        self.render_worker = RenderWorker(parent=self, cache=sprite_cache)
+        self.render_worker.frameReady.connect(self.showOverlayFrame)
+        self.render_worker.failed.connect(self.onRenderFailed)
+        with tracer.span('loadSettings'):
+            self.settings = self.loadSettings()
         self.monitors = self.getMonitors()
+        # The overlay comes back before any of the settings UI is built
+        self.restoreOverlay()
         
         # Initialize system tray
         icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons', 'crossgen.ico')
@@ -401,7 +1369,28 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
             print("Warning: Tray icon file not found:", icon_path)
             self.tray_icon = None
             
-        self.initUI()
+        with tracer.span('initUI'):
+            self.initUI()
+
+    def restoreOverlay(self):
+        """Brings back the last applied overlay at launch, straight from the render cache when possible"""
+        screens = QtWidgets.QApplication.screens()
+        if 'shape' not in self.settings or self.settings.get('monitor_index', 0) >= len(screens):
+            return  # Nothing applied yet, or the monitor is gone
+        dpr = screens[self.settings['monitor_index']].devicePixelRatio()
+        cache = self.render_worker.cache
+        with tracer.span('restoreOverlay'):
+            sprite = cache.load(self.settings, dpr, pin=True)
+        if sprite is not None:
+            self.showOverlayFrame(sprite, self.settings, dpr)
+            # The overlay reads the mapped file until its first paint, then lets go of it
+            key = SpriteCache.key(self.settings, dpr)
+            if getattr(self, 'crosshair', None) is not None and self.crosshair.sprite is sprite:
+                self.crosshair.pinned = (cache, key)
+            else:
+                cache.release(key)
+        else:
+            self.render_worker.request(self.settings, dpr)
 
     def getMonitors(self):
         monitors = []
@@ -427,19 +1416,72 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         
         # Build main layout using helper methods.
         main_layout = QtWidgets.QVBoxLayout()
+        preview = self.setupPreview()
+        main_layout.addWidget(preview)
         tabs = self.setupTabs()
         main_layout.addWidget(tabs)
         buttons = self.setupControlButtons()
         main_layout.addLayout(buttons)
         self.setLayout(main_layout)
+        self.connectPreviewSignals()
         
-        self.setWindowTitle('Crossgen 1.4')
+        self.setWindowTitle(f'Crossgen {__version__}')
         self.setFixedWidth(300)  # Reduce window width
         
         # Initial update
         self.updateSettingsAvailability(self.shape_combo.currentText())
         self.show()
 
+    def setupPreview(self):
+        preview_group = QtWidgets.QGroupBox("Preview")
+        preview_layout = QtWidgets.QVBoxLayout()
+
+        self.preview = ReticlePreview()
+        preview_layout.addWidget(self.preview)
+
+        zoom_layout = QtWidgets.QHBoxLayout()
+        zoom_layout.addWidget(QtWidgets.QLabel("Zoom:"))
+        self.zoom_spin = QtWidgets.QSpinBox()
+        self.zoom_spin.setRange(2, 16)
+        self.zoom_spin.setSuffix('x')
+        self.zoom_spin.setValue(self.settings.get('preview_zoom', 4))
+        self.zoom_spin.valueChanged.connect(self.preview.setZoom)
+        self.preview.setZoom(self.zoom_spin.value())
+        zoom_layout.addWidget(self.zoom_spin)
+        zoom_layout.addStretch()
+        preview_layout.addLayout(zoom_layout)
+
+        preview_group.setLayout(preview_layout)
+
+        # The overlay follows the preview once editing pauses
+        self.apply_timer = QtCore.QTimer(self)
+        self.apply_timer.setSingleShot(True)
+        self.apply_timer.setInterval(400)
+        self.apply_timer.timeout.connect(self.updateCrosshair)
+        self.syncing_controls = False
+        return preview_group
+
+    def connectPreviewSignals(self):
+        for name, signal in self.PREVIEW_CONTROLS:
+            getattr(getattr(self, name), signal).connect(
+                lambda value, name=name: self.onControlChanged(name, value))
+        self.preview.setSettings(self.settings)
+
+    def onControlChanged(self, name, value):
+        if self.syncing_controls:
+            return
+        recorder.record('set', name, value)
+        self.onSettingChanged()
+
+    def onSettingChanged(self, *args):
+        """Refreshes the preview at control rate; the overlay is rebuilt once input goes idle"""
+        if self.syncing_controls:
+            return
+        self.collectSettings()
+        self.preview.setSettings(self.settings)
+        if self.crosshair:
+            self.apply_timer.start()
+
     def setupTabs(self):
         tabs = QtWidgets.QTabWidget()
         basic_tab = self.setupBasicTab()
@@ -459,7 +1501,7 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         # First row - Shape and Fill Style
         shape_layout.addWidget(QtWidgets.QLabel("Shape:"), 0, 0)
         self.shape_combo = QtWidgets.QComboBox()
-        self.shape_combo.addItems(['Crosshair', 'Circle', 'T-Shape', 'X-Shape', 'Diamond'])
+        self.shape_combo.addItems(['Crosshair', 'Circle', 'T-Shape', 'X-Shape', 'Diamond', *RANGING_SHAPES])
         shape_layout.addWidget(self.shape_combo, 0, 1)
 
         shape_layout.addWidget(QtWidgets.QLabel("Fill Style:"), 0, 2)
@@ -470,7 +1512,7 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         # Second row - Size and Thickness
         shape_layout.addWidget(QtWidgets.QLabel("Size:"), 1, 0)
         self.size_spin = QtWidgets.QSpinBox()
-        self.size_spin.setRange(8, 100)
+        self.size_spin.setRange(8, 400)
         self.size_spin.setSingleStep(2)
         self.size_spin.setValue(max(8, self.settings.get('size', 8) // 2 * 2))
         shape_layout.addWidget(self.size_spin, 1, 1)
@@ -581,11 +1623,49 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         self.angle_spin = QtWidgets.QSpinBox()
         self.angle_spin.setRange(0, 360)  # Expanded range to allow full rotation
         self.angle_spin.setValue(self.settings.get('crosshair_angle', 45))
-        self.angle_spin.setEnabled(self.shape_combo.currentText() in ['Crosshair', 'X-Shape', 'Diamond'])
+        self.angle_spin.setEnabled(self.shape_combo.currentText() in ['Crosshair', 'X-Shape', 'Diamond', *RANGING_SHAPES])
         advanced_settings_layout.addWidget(self.angle_spin, 1, 1, 1, 2)
 
         advanced_group.setLayout(advanced_settings_layout)
 
+        # Ranging Group - scale of the Mil-Dot and Tick Scale shapes
+        self.ranging_group = QtWidgets.QGroupBox("Ranging")
+        ranging_layout = QtWidgets.QGridLayout()
+
+        ranging_layout.addWidget(QtWidgets.QLabel("Px/Mil:"), 0, 0)
+        self.subtension_spin = QtWidgets.QSpinBox()
+        self.subtension_spin.setRange(2, 100)
+        self.subtension_spin.setValue(self.settings.get('subtension', 10))
+        ranging_layout.addWidget(self.subtension_spin, 0, 1)
+
+        ranging_layout.addWidget(QtWidgets.QLabel("Mil Dots:"), 0, 2)
+        self.mil_dots_spin = QtWidgets.QSpinBox()
+        self.mil_dots_spin.setRange(1, 50)
+        self.mil_dots_spin.setValue(self.settings.get('mil_dots', 4))
+        ranging_layout.addWidget(self.mil_dots_spin, 0, 3)
+
+        ranging_layout.addWidget(QtWidgets.QLabel("Tick Mils:"), 1, 0)
+        self.tick_spacing_spin = QtWidgets.QDoubleSpinBox()
+        self.tick_spacing_spin.setRange(0.1, 5.0)
+        self.tick_spacing_spin.setSingleStep(0.1)
+        self.tick_spacing_spin.setDecimals(1)
+        self.tick_spacing_spin.setValue(self.settings.get('tick_spacing', 0.5))
+        ranging_layout.addWidget(self.tick_spacing_spin, 1, 1)
+
+        ranging_layout.addWidget(QtWidgets.QLabel("Ticks:"), 2, 0)
+        self.tick_length_spin = QtWidgets.QSpinBox()
+        self.tick_length_spin.setRange(1, 40)
+        self.tick_length_spin.setValue(self.settings.get('tick_length', 4))
+        ranging_layout.addWidget(self.tick_length_spin, 2, 1)
+
+        ranging_layout.addWidget(QtWidgets.QLabel("Major:"), 2, 2)
+        self.major_tick_length_spin = QtWidgets.QSpinBox()
+        self.major_tick_length_spin.setRange(1, 80)
+        self.major_tick_length_spin.setValue(self.settings.get('major_tick_length', 8))
+        ranging_layout.addWidget(self.major_tick_length_spin, 2, 3)
+
+        self.ranging_group.setLayout(ranging_layout)
+
         # Monitor & Resolution Group
         monitor_group = QtWidgets.QGroupBox("Monitor & Resolution")
         monitor_layout = QtWidgets.QGridLayout()
@@ -604,16 +1684,58 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
 
         monitor_group.setLayout(monitor_layout)
 
+        # Layers Group - extra shapes composited beneath the current one
+        layers_group = QtWidgets.QGroupBox("Layers")
+        layers_layout = QtWidgets.QGridLayout()
+
+        self.layers_list = QtWidgets.QListWidget()
+        self.layers_list.setFixedHeight(80)
+        layers_layout.addWidget(self.layers_list, 0, 0, 1, 2)
+
+        add_layer_button = QtWidgets.QPushButton('Add Current')
+        add_layer_button.clicked.connect(self.addLayer)
+        layers_layout.addWidget(add_layer_button, 1, 0)
+        remove_layer_button = QtWidgets.QPushButton('Remove')
+        remove_layer_button.clicked.connect(self.removeLayer)
+        layers_layout.addWidget(remove_layer_button, 1, 1)
+
+        layers_group.setLayout(layers_layout)
+        self.updateLayersList()
+
+        # Markers Group - extra reticle instances spread over the screen
+        markers_group = QtWidgets.QGroupBox("Markers")
+        markers_layout = QtWidgets.QGridLayout()
+
+        markers_layout.addWidget(QtWidgets.QLabel("Grid:"), 0, 0)
+        self.marker_rows_spin = QtWidgets.QSpinBox()
+        self.marker_rows_spin.setRange(1, 50)
+        self.marker_rows_spin.setValue(3)
+        markers_layout.addWidget(self.marker_rows_spin, 0, 1)
+        markers_layout.addWidget(QtWidgets.QLabel("x"), 0, 2)
+        self.marker_cols_spin = QtWidgets.QSpinBox()
+        self.marker_cols_spin.setRange(1, 50)
+        self.marker_cols_spin.setValue(3)
+        markers_layout.addWidget(self.marker_cols_spin, 0, 3)
+
+        grid_button = QtWidgets.QPushButton('Show Grid')
+        grid_button.clicked.connect(lambda: self.setMarkerGrid(self.marker_rows_spin.value(), self.marker_cols_spin.value()))
+        markers_layout.addWidget(grid_button, 1, 0, 1, 2)
+        clear_markers_button = QtWidgets.QPushButton('Clear')
+        clear_markers_button.clicked.connect(lambda: self.setMarkerGrid(0, 0))
+        markers_layout.addWidget(clear_markers_button, 1, 2, 1, 2)
+
+        markers_group.setLayout(markers_layout)
+
         # Add groups to main layout
         advanced_layout.addWidget(advanced_group)
+        advanced_layout.addWidget(self.ranging_group)
         advanced_layout.addWidget(monitor_group)
+        advanced_layout.addWidget(layers_group)
+        advanced_layout.addWidget(markers_group)
         advanced_layout.addStretch()
 
         # Connect signals
         self.dot_enabled.stateChanged.connect(self.dot_size_spin.setEnabled)
-        self.dot_enabled.stateChanged.connect(self.updateCrosshair)
-        self.dot_size_spin.valueChanged.connect(self.updateCrosshair)
-        self.angle_spin.valueChanged.connect(self.updateCrosshair)
         self.monitor_combo.currentIndexChanged.connect(self.updateResolutionCombo)
         self.resolution_combo.currentIndexChanged.connect(self.handleResolutionChange)
 
@@ -624,7 +1746,7 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         button_layout = QtWidgets.QHBoxLayout()
         
         buttons = {
-            'Apply': self.updateCrosshair,
+            'Apply': self.applyCrosshair,
             'Save': self.savePreset,
             'Load': self.loadPreset,
             'Clear': self.clearPreset
@@ -662,6 +1784,7 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
                 'dot_enabled': True,
                 'dot_size': 2,
                 'crosshair_angle': 0,  # Replace x_angle with crosshair_angle
+                'layers': [],  # Extra layers drawn beneath the main shape, bottom first
             }
 
     def saveSettings(self):
@@ -673,10 +1796,13 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         self.fill_style_combo.setEnabled(shape == 'Circle')
         
         # Enable gap for all shapes except Circle
-        self.gap_spin.setEnabled(shape in ['Crosshair', 'T-Shape', 'X-Shape', 'Diamond'])
+        self.gap_spin.setEnabled(shape in ['Crosshair', 'T-Shape', 'X-Shape', 'Diamond', *RANGING_SHAPES])
         
         # Enable angle spinner for multiple shapes
-        self.angle_spin.setEnabled(shape in ['Crosshair', 'X-Shape', 'Diamond'])
+        self.angle_spin.setEnabled(shape in ['Crosshair', 'X-Shape', 'Diamond', *RANGING_SHAPES])
+        
+        # Enable ranging scale for the ranging shapes
+        self.ranging_group.setEnabled(shape in RANGING_SHAPES)
         
         # Enable outline for all shapes
         self.outline_check.setEnabled(True)
@@ -692,74 +1818,179 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         color = QtWidgets.QColorDialog.getColor()
         if (color.isValid()):
             self.settings[color_type] = color.name()
+            recorder.record('color', color_type, color.name())
             preview_widget.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #888;")
-            if self.crosshair:
-                self.updateCrosshair()
+            self.onSettingChanged()
+
+    def updateLayersList(self):
+        self.layers_list.clear()
+        for layer in self.settings.get('layers', []):
+            self.layers_list.addItem(f"{layer.get('shape', 'Crosshair')} {layer.get('size', '')} {layer.get('color', '')}")
+
+    def addLayer(self):
+        """Pushes the current shape onto the layer stack"""
+        recorder.record('layer_add')
+        self.collectSettings()
+        layer = {key: self.settings[key] for key in LAYER_KEYS if key in self.settings}
+        self.settings.setdefault('layers', []).append(layer)
+        self.updateLayersList()
+        self.updateCrosshair()
+
+    def removeLayer(self):
+        row = self.layers_list.currentRow()
+        if row < 0:
+            return
+        recorder.record('layer_remove', value=row)
+        del self.settings['layers'][row]
+        self.updateLayersList()
+        self.updateCrosshair()
+
+    def setMarkerGrid(self, rows, cols):
+        """Replaces the markers with an evenly spaced grid over the selected monitor; 0 clears them"""
+        recorder.record('markers', value=[rows, cols])
+        geometry = QtWidgets.QApplication.screens()[self.monitor_combo.currentIndex()].geometry()
+        self.settings['markers'] = [
+            {'x': round((col + 0.5) * geometry.width() / cols), 'y': round((row + 0.5) * geometry.height() / rows)}
+            for row in range(rows) for col in range(cols)
+        ]
+        self.updateCrosshair()
+
+    def updateMarkers(self, sprite, settings, dpr=None):
+        """Lays out the markers of the overlay frame just shown"""
+        markers = settings.get('markers')
+        if not markers:
+            if self.marker_overlay:
+                self.marker_overlay.close()
+                self.marker_overlay.worker.shutdown()
+                self.marker_overlay = None
+            return
+        if self.marker_overlay is None:
+            self.marker_overlay = MarkerOverlay(self.render_worker.cache)
+            self.marker_overlay.worker.failed.connect(self.onRenderFailed)
+        self.marker_overlay.setGeometry(QtWidgets.QApplication.screens()[settings['monitor_index']].geometry())
+        self.marker_overlay.setMarkers(markers, settings, sprite, dpr)
+        self.marker_overlay.show()
 
     def updateResolutionCombo(self, index):
-        self.resolution_combo.clear()
-        self.resolution_combo.addItems(self.monitors[index]['resolutions'])
+        if not self.syncing_controls:
+            recorder.record('set', 'monitor_combo', index)  # By index, as monitor names differ between machines
+        syncing, self.syncing_controls = self.syncing_controls, True
+        try:
+            self.resolution_combo.clear()
+            self.resolution_combo.addItems(self.monitors[index]['resolutions'])
+        finally:
+            self.syncing_controls = syncing
 
     def handleResolutionChange(self, index):
+        if self.syncing_controls:
+            return
         if self.resolution_combo.currentText() == "Custom...":
             dialog = CustomResolutionDialog(self)
             if dialog.exec_() == QDialog.Accepted:
                 try:
                     width = int(dialog.width_input.text())
                     height = int(dialog.height_input.text())
-                    self.settings['custom_resolution'] = (width, height)
-                    self.updateCrosshair()
                 except ValueError:
                     QtWidgets.QMessageBox.warning(self, "Error", "Invalid resolution values")
+                    return
+                recorder.record('resolution', value=[width, height])
+                self.setCustomResolution(width, height)
+        else:
+            recorder.record('set', 'resolution_combo', self.resolution_combo.currentText())
+
+    def setCustomResolution(self, width, height):
+        self.settings['custom_resolution'] = (width, height)
+        self.updateCrosshair()
+
+    def collectSettings(self):
+        """Updates settings from UI controls"""
+        self.settings.update({
+            'monitor_index': self.monitor_combo.currentIndex(),
+            'resolution': self.resolution_combo.currentText(),
+            'shape': self.shape_combo.currentText(),
+            'size': self.size_spin.value() // 2 * 2,
+            'thickness': self.thickness_spin.value(),
+            'gap': self.gap_spin.value(),
+            'opacity': self.opacity_slider.value(),
+            'outline_enabled': self.outline_check.isChecked(),
+            'outline_opacity': self.outline_opacity_slider.value(),
+            'outline_thickness': self.outline_thickness_spin.value(),
+            'fill_style': self.fill_style_combo.currentText(),
+            'crosshair_angle': self.angle_spin.value(),  # Update angle for all supported shapes
+            'dot_enabled': self.dot_enabled.isChecked(),
+            'dot_size': self.dot_size_spin.value() if self.dot_enabled.isChecked() else 0,
+            'subtension': self.subtension_spin.value(),
+            'tick_spacing': round(self.tick_spacing_spin.value(), 1),
+            'tick_length': self.tick_length_spin.value(),
+            'major_tick_length': self.major_tick_length_spin.value(),
+            'mil_dots': self.mil_dots_spin.value(),
+            'preview_zoom': self.zoom_spin.value(),
+        })
+
+    def applyCrosshair(self):
+        recorder.record('apply')
+        self.updateCrosshair()
 
     def updateCrosshair(self):
+        with tracer.span('updateCrosshair'):
+            self._updateCrosshair()
+
+    def _updateCrosshair(self):
         try:
-            # Update settings from UI controls
-            self.settings.update({
-                'monitor_index': self.monitor_combo.currentIndex(),
-                'resolution': self.resolution_combo.currentText(),
-                'shape': self.shape_combo.currentText(),
-                'size': self.size_spin.value() // 2 * 2,
-                'thickness': self.thickness_spin.value(),
-                'gap': self.gap_spin.value(),
-                'opacity': self.opacity_slider.value(),
-                'outline_enabled': self.outline_check.isChecked(),
-                'outline_opacity': self.outline_opacity_slider.value(),
-                'outline_thickness': self.outline_thickness_spin.value(),
-                'fill_style': self.fill_style_combo.currentText(),
-                'crosshair_angle': self.angle_spin.value(),  # Update angle for all supported shapes
-                'dot_enabled': self.dot_enabled.isChecked(),
-                'dot_size': self.dot_size_spin.value() if self.dot_enabled.isChecked() else 0,
-            })
+            self.apply_timer.stop()
+            with tracer.span('collectSettings'):
+                self.collectSettings()
+            self.preview.setSettings(self.settings)
+
+            # Rasterize off the GUI thread; the current overlay stays up until the frame lands
+            screen = QtWidgets.QApplication.screens()[self.settings['monitor_index']]
+            self.render_worker.request(self.settings, screen.devicePixelRatio())
+            
+            # Save settings
+            with tracer.span('saveSettings'):
+                self.saveSettings()
+            
+        except Exception as e:
+            import traceback
+            error_msg = f'Failed to update crosshair: {str(e)}\n{traceback.format_exc()}'
+            QtWidgets.QMessageBox.warning(self, 'Error', error_msg)
 
+    def showOverlayFrame(self, sprite, settings, dpr=None):
+        """Swaps in a new overlay once its frame has been rendered"""
+        try:
             # Close existing crosshair if it exists
             if hasattr(self, 'crosshair') and self.crosshair:
-                self.crosshair.close()
+                with tracer.span('close'):
+                    self.crosshair.close()
 
-            # Create new crosshair with updated settings
-            self.crosshair = CrosshairCanvas(self.settings)
-            
-            # Set window opacity
-            self.crosshair.setWindowOpacity(self.settings['opacity'] / 100)
+            # Create new crosshair with the rendered frame
+            with tracer.span('CrosshairCanvas'):
+                self.crosshair = CrosshairCanvas(settings, sprite=sprite, dpr=dpr)
             
             # Position the crosshair
-            screen = QtWidgets.QApplication.screens()[self.settings['monitor_index']]
+            screen = QtWidgets.QApplication.screens()[settings['monitor_index']]
             geometry = screen.geometry()
-            x = int(geometry.x() + (geometry.width() - self.settings['size']) // 2)
-            y = int(geometry.y() + (geometry.height() - self.settings['size']) // 2)
-            self.crosshair.move(x, y)
+            x = int(geometry.x() + (geometry.width() - self.crosshair.width()) // 2)
+            y = int(geometry.y() + (geometry.height() - self.crosshair.height()) // 2)
+            with tracer.span('move'):
+                self.crosshair.move(x, y)
             
             # Show the crosshair
-            self.crosshair.show()
-            
-            # Save settings
-            self.saveSettings()
+            with tracer.span('show'):
+                self.crosshair.show()
+
+            with tracer.span('updateMarkers'):
+                self.updateMarkers(sprite, settings, dpr)
             
         except Exception as e:
             import traceback
-            error_msg = f'Failed to update crosshair: {str(e)}\n{traceback.format_exc()}'
+            error_msg = f'Failed to show crosshair: {str(e)}\n{traceback.format_exc()}'
             QtWidgets.QMessageBox.warning(self, 'Error', error_msg)
 
+    def onRenderFailed(self, message):
+        """The worker could not render the requested frame; the previous overlay stays up"""
+        QtWidgets.QMessageBox.warning(self, 'Error', f'Failed to render crosshair: {message}')
+
     def savePreset(self):
         name, ok = QtWidgets.QInputDialog.getText(self, 'Save Preset', 'Enter preset name:')
         if not ok or not name.strip():
@@ -773,6 +2004,7 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         try:
             with open(preset_path, "w") as f:
                 json.dump(self.settings, f, indent=4)
+            recorder.record('save', name.strip())
             QtWidgets.QMessageBox.information(self, "Preset Saved", f"Preset '{name}' saved successfully!")
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "Error", f"Failed to save preset: {str(e)}")
@@ -785,9 +2017,9 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "Error", "No presets found!")
             return
 
-        preset_files = [f.replace(".json", "") for f in os.listdir(presets_dir) if f.endswith(".json")]
-        
-        preset, ok = QtWidgets.QInputDialog.getItem(self, "Load Preset", "Select a preset:", preset_files, 0, False)
+        dialog = PresetGalleryDialog(presets_dir, self)
+        ok = dialog.exec_() == QDialog.Accepted
+        preset = dialog.selectedPreset()
         
         if not ok or not preset:
             return  # User canceled selection
@@ -796,21 +2028,50 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
 
         try:
             with open(preset_path, "r") as f:
-                self.settings = json.load(f)
-            
-            # Update UI elements to match loaded preset
+                self.applyPreset(json.load(f))
+            QtWidgets.QMessageBox.information(self, "Preset Loaded", f"Preset '{preset}' loaded successfully!")
+        
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to load preset: {str(e)}")
+
+    def applyPreset(self, settings):
+        recorder.record('load', value=settings)
+        self.settings = settings
+        
+        # Update UI elements to match loaded preset without feeding
+        # half-updated controls back into the settings
+        self.syncing_controls = True
+        try:
             self.shape_combo.setCurrentText(self.settings['shape'])
             self.size_spin.setValue(self.settings['size'])
             self.thickness_spin.setValue(self.settings['thickness'])
             self.opacity_slider.setValue(self.settings['opacity'])
             self.fill_style_combo.setCurrentText(self.settings['fill_style'])
             self.outline_check.setChecked(self.settings['outline_enabled'])
-            
-            self.updateCrosshair()
-            QtWidgets.QMessageBox.information(self, "Preset Loaded", f"Preset '{preset}' loaded successfully!")
+
+            # Every other control collectSettings reads; keys missing from older presets keep the current value
+            if self.settings.get('monitor_index', 0) < self.monitor_combo.count():
+                self.monitor_combo.setCurrentIndex(self.settings.get('monitor_index', 0))
+            if self.resolution_combo.findText(self.settings.get('resolution', '')) >= 0:
+                self.resolution_combo.setCurrentText(self.settings['resolution'])
+            self.gap_spin.setValue(self.settings.get('gap', self.gap_spin.value()))
+            self.outline_opacity_slider.setValue(self.settings.get('outline_opacity', self.outline_opacity_slider.value()))
+            self.outline_thickness_spin.setValue(self.settings.get('outline_thickness', self.outline_thickness_spin.value()))
+            self.angle_spin.setValue(self.settings.get('crosshair_angle', self.angle_spin.value()))
+            self.dot_enabled.setChecked(self.settings.get('dot_enabled', self.dot_enabled.isChecked()))
+            if self.settings.get('dot_size'):
+                self.dot_size_spin.setValue(self.settings['dot_size'])
+            self.subtension_spin.setValue(self.settings.get('subtension', self.subtension_spin.value()))
+            self.tick_spacing_spin.setValue(self.settings.get('tick_spacing', self.tick_spacing_spin.value()))
+            self.tick_length_spin.setValue(self.settings.get('tick_length', self.tick_length_spin.value()))
+            self.major_tick_length_spin.setValue(self.settings.get('major_tick_length', self.major_tick_length_spin.value()))
+            self.mil_dots_spin.setValue(self.settings.get('mil_dots', self.mil_dots_spin.value()))
+            self.zoom_spin.setValue(self.settings.get('preview_zoom', self.zoom_spin.value()))
+        finally:
+            self.syncing_controls = False
+        self.updateLayersList()
         
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to load preset: {str(e)}")
+        self.updateCrosshair()
 
     def clearPreset(self):
         presets_dir = os.path.join(os.path.expanduser("~"), ".crossgen", "presets")
@@ -842,14 +2103,288 @@ class AdvancedSettingsWindow(QtWidgets.QWidget):
         else:
             if self.crosshair:
                 self.crosshair.close()
+            if self.marker_overlay:
+                self.marker_overlay.close()
             event.accept()
 
     def updateXAngleAvailability(self, shape):
         """Enable X Angle spinner only for X-Shape"""
         self.angle_spin.setEnabled(shape == 'X-Shape')
 
+class ReplayWindow(AdvancedSettingsWindow):
+    """
+    Settings window driven by a recorded session. It starts from the session's settings
+    and keeps settings, presets and the render cache in a scratch directory, so replays
+    are reproducible and never touch the user's own data.
+    """
+    def __init__(self, settings, work_dir):
+        self.initial_settings = settings
+        self.work_dir = work_dir
+        self.apply_started = None
+        self.apply_latencies = []
+        self.render_failures = 0
+        super().__init__()
+        self.render_worker.cache = SpriteCache(os.path.join(work_dir, 'sprites'))
+
+    def loadSettings(self):
+        return copy.deepcopy(self.initial_settings)
+
+    def saveSettings(self):
+        with open(os.path.join(self.work_dir, 'settings.json'), 'w') as f:
+            json.dump(self.settings, f)
+
+    def restoreOverlay(self):
+        pass  # Sessions start without an overlay; the first apply builds it
+
+    def updateCrosshair(self):
+        # Latency runs from the first apply still waiting for a frame
+        if self.apply_started is None:
+            self.apply_started = time.perf_counter()
+        super().updateCrosshair()
+
+    def showOverlayFrame(self, sprite, settings, dpr=None):
+        super().showOverlayFrame(sprite, settings, dpr)
+        if self.apply_started is not None:
+            self.apply_latencies.append(time.perf_counter() - self.apply_started)
+            self.apply_started = None
+
+    def onRenderFailed(self, message):
+        self.render_failures += 1
+        self.apply_started = None
+        print(f"Warning: Failed to render crosshair: {message}")
+
+    @property
+    def busy(self) -> bool:
+        return self.apply_started is not None or self.apply_timer.isActive()
+
+    def replay(self, kind, target, value):
+        handlers = {
+            'set': lambda: self.replaySet(target, value),
+            'color': lambda: self.replayColor(target, value),
+            'apply': self.updateCrosshair,
+            'resolution': lambda: self.replayResolution(*value),
+            'layer_add': self.addLayer,
+            'layer_remove': lambda: self.replayLayerRemove(value),
+            'load': lambda: self.applyPreset(value),
+            'markers': lambda: self.setMarkerGrid(*value),
+            'save': lambda: self.replaySave(target),
+        }
+        handlers[kind]()
+
+    def replaySet(self, name, value):
+        control = getattr(self, name)
+        if isinstance(control, QtWidgets.QComboBox) and isinstance(value, int):
+            control.setCurrentIndex(min(value, control.count() - 1))
+        elif isinstance(control, QtWidgets.QComboBox):
+            control.setCurrentText(value)
+        elif isinstance(control, QtWidgets.QCheckBox):
+            control.setCheckState(Qt.CheckState(value))
+        else:
+            control.setValue(value)
+
+    def replayColor(self, color_type, color):
+        self.settings[color_type] = color
+        self.onSettingChanged()
+
+    def replayResolution(self, width, height):
+        self.syncing_controls = True  # Select Custom... without opening its dialog
+        self.resolution_combo.setCurrentText("Custom...")
+        self.syncing_controls = False
+        self.setCustomResolution(width, height)
+
+    def replayLayerRemove(self, row):
+        self.layers_list.setCurrentRow(row)
+        self.removeLayer()
+
+    def replaySave(self, name):
+        os.makedirs(os.path.join(self.work_dir, 'presets'), exist_ok=True)
+        with open(os.path.join(self.work_dir, 'presets', f"{name}.json"), "w") as f:
+            json.dump(self.settings, f, indent=4)
+
+    def shutdown(self):
+        """Stops every render worker; replays return without running the event loop to aboutToQuit"""
+        workers = [self.render_worker, self.preview.worker]
+        if self.marker_overlay:
+            workers.append(self.marker_overlay.worker)
+        for worker in workers:
+            worker.shutdown()
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _wait(ms):
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(max(0, int(ms)), loop.quit)
+    loop.exec_()
+
+
+def replay_session(path, fast=False, trace_path=None) -> int:
+    """
+    Replays a recorded session headlessly, at recorded speed or as fast as possible,
+    and prints apply latency percentiles along with paint and rebuild counts.
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    with open(path) as f:
+        header = json.loads(f.readline())
+        events = [json.loads(line) for line in f if line.strip()]
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    app.setQuitOnLastWindowClosed(False)
+    tracer.clear()
+    tracer.enabled = True
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        window = ReplayWindow(header['settings'], work_dir)
+        start = time.perf_counter()
+        for timestamp, kind, target, value in events:
+            if not fast:
+                _wait((timestamp - (time.perf_counter() - start)) * 1000)
+            window.replay(kind, target, value)
+            app.processEvents()
+
+        # Let idle applies and in-flight frames land
+        deadline = time.perf_counter() + 5
+        while window.busy and time.perf_counter() < deadline:
+            _wait(10)
+        elapsed = time.perf_counter() - start
+        window.shutdown()
+
+    durations = {}
+    for event in tracer.events:
+        durations.setdefault(event['name'], []).append(event['dur'] / 1000)
+    latencies = [latency * 1000 for latency in window.apply_latencies]
+
+    print(f"Replayed {len(events)} events in {elapsed:.2f} s ({'fast' if fast else 'recorded speed'})")
+    for label, values in (('apply latency', latencies), ('updateCrosshair', durations.get('updateCrosshair', []))):
+        print(f"{label + ' ms:':<20} p50 {_percentile(values, 50):7.2f}  p90 {_percentile(values, 90):7.2f}  "
+              f"p99 {_percentile(values, 99):7.2f}  max {max(values, default=0):7.2f}  (n={len(values)})")
+    print(f"{'paints:':<20} {len(durations.get('paintEvent', []))}")
+    print(f"{'rebuilds:':<20} {len(durations.get('CrosshairCanvas', []))}")
+    print(f"{'overlay renders:':<20} {len(durations.get('render', []))}")
+    print(f"{'preview renders:':<20} {len(durations.get('preview render', []))}")
+    print(f"{'marker renders:':<20} {len(durations.get('marker render', []))}")
+    print(f"{'render failures:':<20} {window.render_failures}")
+
+    if trace_path:
+        tracer.export(trace_path)
+    return 0
+
+
+def _time_ms(func, repeat=20) -> float:
+    """Median wall time of func in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return _percentile(samples, 50)
+
+
+def _benchmark_markers(target):
+    settings = {'shape': 'Crosshair', 'size': 24, 'thickness': 2, 'color': '#00FF00', 'outline_enabled': True}
+
+    def paint_each(markers):
+        # Baseline: every marker drawn through its own painter state, like one canvas per marker
+        target.fill(Qt.transparent)
+        painter = QtGui.QPainter(target)
+        reticle = Reticle(settings)
+        for marker in markers:
+            painter.save()
+            painter.translate(marker['x'] - 12, marker['y'] - 12)
+            reticle.paint(painter)
+            painter.restore()
+        painter.end()
+
+    def paint_batched():
+        target.fill(Qt.transparent)
+        overlay.render(target)
+
+    def blit_each(markers, pixmap):
+        # Baseline: the same cached sprite, blitted with one drawPixmap per marker
+        target.fill(Qt.transparent)
+        painter = QtGui.QPainter(target)
+        half = pixmap.width() / pixmap.devicePixelRatio() / 2
+        for marker in markers:
+            painter.drawPixmap(QPointF(marker['x'] - half, marker['y'] - half), pixmap)
+        painter.end()
+
+    print("Markers      batched ms   per-blit ms   per-marker ms   moved-marker ms")
+    overlay = MarkerOverlay()
+    overlay.setGeometry(0, 0, target.width(), target.height())
+    sprite = ReticleRenderer().render(settings, overlay.devicePixelRatioF())
+    pixmap = QtGui.QPixmap.fromImage(sprite)
+    for count in (1, 10, 100, 1000):
+        markers = [{'x': 20 + (i * 37) % 1880, 'y': 20 + (i * 53) % 1040} for i in range(count)]
+        overlay.setMarkers(markers, settings, sprite)
+        batched = _time_ms(paint_batched)
+        blit = _time_ms(lambda: blit_each(markers, pixmap))
+        each = _time_ms(lambda: paint_each(markers))
+        overlay.moveMarker(0, 500, 500)
+        dirty = QtGui.QRegion(QtCore.QRect(480, 480, 40, 40)).united(overlay.fragmentRect(*overlay.instances[0]))
+        moved = _time_ms(lambda: overlay.render(target, QPoint(), dirty))
+        print(f"{count:>7} {batched:>14.3f} {blit:>13.3f} {each:>15.3f} {moved:>17.3f}")
+
+
+def _benchmark_ranging(target):
+    def paint_ranging(spec):
+        target.fill(Qt.transparent)
+        painter = QtGui.QPainter(target)
+        Reticle(spec).paint(painter)
+        painter.end()
+
+    def paint_ranging_per_call(spec):
+        # Baseline: one drawLine per tick with fresh QPointFs, in the style of _draw_crosshair
+        lines, _ = ranging_geometry('Tick Scale', spec['size'], 0, spec['subtension'], spec['tick_spacing'], 4, 8, 0)
+        target.fill(Qt.transparent)
+        painter = QtGui.QPainter(target)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(Reticle(spec).create_pen(False, 'Tick Scale'))
+        painter.translate(spec['size'] / 2, spec['size'] / 2)
+        for x1, y1, x2, y2 in lines:
+            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.end()
+
+    print("Ticks        batched ms   per-call ms")
+    for tick_spacing in (2.0, 1.0, 0.5, 0.2, 0.1):
+        spec = {'shape': 'Tick Scale', 'size': 400, 'gap': 0, 'subtension': 2, 'tick_spacing': tick_spacing,
+                'color': '#00FF00', 'dot_enabled': False}
+        ticks = len(ranging_geometry('Tick Scale', 400, 0, 2, tick_spacing, 4, 8, 0)[0]) - 4
+        batched = _time_ms(lambda: paint_ranging(spec))
+        per_call = _time_ms(lambda: paint_ranging_per_call(spec))
+        print(f"{ticks:>5} {batched:>17.3f} {per_call:>13.3f}")
+
+
+def run_benchmark() -> int:
+    """Prints offscreen paint timings for the batched render paths"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QtWidgets.QApplication(sys.argv[:1])
+    target = QtGui.QImage(1920, 1080, QtGui.QImage.Format_ARGB32_Premultiplied)
+    _benchmark_markers(target)
+    print()
+    _benchmark_ranging(target)
+    app.quit()
+    return 0
+
+
 if __name__ == '__main__':
-    app = QtWidgets.QApplication([])
+    parser = argparse.ArgumentParser(description='Draws a crosshair on top of all other windows.')
+    parser.add_argument('--replay', metavar='SESSION', help='replay a recorded session headlessly and report timings')
+    parser.add_argument('--fast', action='store_true', help='replay as fast as possible instead of at recorded speed')
+    parser.add_argument('--trace', metavar='FILE', help='write the replay trace as trace-event JSON')
+    parser.add_argument('--benchmark', action='store_true', help='print offscreen paint timings and exit')
+    args = parser.parse_args()
+    if args.replay:
+        sys.exit(replay_session(args.replay, args.fast, args.trace))
+    if args.benchmark:
+        sys.exit(run_benchmark())
+
+    with tracer.span('QApplication'):
+        app = QtWidgets.QApplication([])
     
     # Prevent the application from exiting when all windows are closed
     app.setQuitOnLastWindowClosed(False)
@@ -860,7 +2395,14 @@ if __name__ == '__main__':
         app.setWindowIcon(app_icon)
     
     # Create and show the main window
-    ex = AdvancedSettingsWindow()
+    with tracer.span('AdvancedSettingsWindow'):
+        ex = AdvancedSettingsWindow()
+    
+    # Only interactive sessions are recorded, never replays
+    if os.environ.get('CROSSGEN_RECORD'):
+        recorder.start(os.environ['CROSSGEN_RECORD'], ex.settings)
+        if ex.tray_icon:
+            ex.tray_icon.record_action.setChecked(True)
     
     if app_icon:
         ex.setWindowIcon(app_icon)
@@ -0,0 +1,93 @@
+import math
+import threading
+
+from crossgen import ranging_geometry, ranging_paths
+
+
+def ticks(lines):
+    return lines[4:]  # The four arms come first
+
+
+def length(line):
+    x1, y1, x2, y2 = line
+    return math.hypot(x2 - x1, y2 - y1)
+
+
+def test_arms_run_from_gap_to_edge():
+    lines, dots = ranging_geometry('Tick Scale', 100, 5, 10, 0.5, 4, 8, 0)
+    assert lines[:4] == ((0.0, -5.0, 0.0, -50.0), (0.0, 5.0, 0.0, 50.0),
+                         (-5.0, 0.0, -50.0, 0.0), (5.0, 0.0, 50.0, 0.0))
+    assert dots == ()
+
+
+def test_tick_count_fills_each_arm():
+    # 0.5 mil at 10 px/mil is a tick every 5 px, 10 per 50 px arm
+    lines, _ = ranging_geometry('Tick Scale', 100, 0, 10, 0.5, 4, 8, 0)
+    assert len(ticks(lines)) == 4 * 10
+
+
+def test_tick_count_survives_float_steps():
+    # 0.1 * 2 px does not divide 200 exactly in floating point
+    lines, _ = ranging_geometry('Tick Scale', 400, 0, 2, 0.1, 4, 8, 0)
+    assert len(ticks(lines)) == 4 * 1000
+
+
+def test_whole_mils_get_major_ticks():
+    lines, _ = ranging_geometry('Tick Scale', 100, 0, 10, 0.1, 4, 8, 0)
+    lengths = [length(line) for line in ticks(lines)[:50]]  # First arm, 50 ticks
+    # 0.1 * 10 and its multiples land on whole mils despite rounding
+    assert [k + 1 for k, value in enumerate(lengths) if value == 8] == [10, 20, 30, 40, 50]
+    assert lengths.count(4) == 45
+
+
+def test_ticks_inside_gap_are_skipped():
+    lines, _ = ranging_geometry('Tick Scale', 100, 12, 10, 0.5, 4, 8, 0)
+    # Ticks at 5 and 10 px fall inside the gap, leaving 15..50 px
+    assert len(ticks(lines)) == 4 * 8
+    for x1, y1, x2, y2 in ticks(lines):
+        assert max(abs(x1 + x2), abs(y1 + y2)) / 2 > 12
+
+
+def test_ticks_are_perpendicular_to_their_arm():
+    lines, _ = ranging_geometry('Tick Scale', 100, 0, 10, 1, 4, 8, 0)
+    x1, y1, x2, y2 = ticks(lines)[0]  # First tick on the upward arm
+    assert (y1, y2) == (-10.0, -10.0)
+    assert sorted((x1, x2)) == [-4.0, 4.0]
+
+
+def test_mil_dots_count_and_radius():
+    _, dots = ranging_geometry('Mil-Dot', 100, 0, 10, 0.5, 4, 8, 4)
+    assert len(dots) == 4 * 4
+    assert {radius for _, _, radius in dots} == {10 / 8}
+    assert (0.0, -10.0, 1.25) in dots and (40.0, 0.0, 1.25) in dots
+
+
+def test_mil_dots_stay_between_gap_and_edge():
+    # 8 dots 10 px apart, but only 15..50 px is visible
+    _, dots = ranging_geometry('Mil-Dot', 100, 15, 10, 0.5, 4, 8, 8)
+    assert len(dots) == 4 * 4
+    assert all(15 < math.hypot(x, y) <= 50 for x, y, _ in dots)
+
+
+def test_small_subtension_dots_keep_minimum_radius():
+    _, dots = ranging_geometry('Mil-Dot', 100, 0, 2, 0.5, 4, 8, 4)
+    assert {radius for _, _, radius in dots} == {0.5}
+
+
+def test_geometry_is_immutable():
+    lines, dots = ranging_geometry('Mil-Dot', 100, 0, 10, 0.5, 4, 8, 4)
+    assert isinstance(lines, tuple) and all(isinstance(line, tuple) for line in lines)
+    assert isinstance(dots, tuple) and all(isinstance(dot, tuple) for dot in dots)
+
+
+def test_paths_are_built_once_per_thread():
+    geometry = ('Mil-Dot', 100, 0, 10, 0.5, 4, 8, 4)
+    lines, dots = ranging_paths(*geometry)
+    assert ranging_paths(*geometry)[0] is lines
+    assert len(lines) == 4 and dots.elementCount() > 0
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(ranging_paths(*geometry)[0]))
+    thread.start()
+    thread.join()
+    assert other[0] is not lines and other[0] == lines
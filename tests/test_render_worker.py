@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+from PyQt5 import QtGui
+
+from crossgen import RenderWorker, ReticleRenderer
+
+
+class GatedRenderer(ReticleRenderer):
+    """Records what it renders and holds the first render until the gate opens"""
+    def __init__(self):
+        super().__init__()
+        self.rendered = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def render(self, settings, dpr=1.0):
+        self.rendered.append(settings['size'])
+        self.started.set()
+        self.gate.wait(5)
+        return QtGui.QImage(4, 4, QtGui.QImage.Format_ARGB32_Premultiplied)
+
+
+@pytest.fixture
+def worker(qapp):
+    worker = RenderWorker(GatedRenderer())
+    worker.frames = []
+    worker.frameReady.connect(lambda sprite, settings: worker.frames.append(settings['size']))
+    yield worker
+    worker.renderer.gate.set()
+    worker.shutdown()
+
+
+def wait_for(qapp, condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.001)
+    assert condition()
+
+
+def settle(qapp, worker):
+    worker.pool.waitForDone()
+    for _ in range(10):
+        qapp.processEvents()
+
+
+def test_superseded_queued_job_never_renders(qapp, worker):
+    worker.request({'size': 10})
+    assert worker.renderer.started.wait(5)  # 10 is rendering, so 20 stays queued
+    worker.request({'size': 20})
+    worker.request({'size': 30})
+    worker.renderer.gate.set()
+
+    wait_for(qapp, lambda: worker.frames)
+    settle(qapp, worker)
+    assert worker.renderer.rendered == [10, 30]
+    assert worker.frames == [30]
+
+
+def test_late_frame_from_older_request_is_dropped(qapp, worker):
+    worker.request({'size': 10})
+    assert worker.renderer.started.wait(5)
+    worker.request({'size': 20})
+    worker.renderer.gate.set()  # 10 finishes after 20 was requested
+
+    wait_for(qapp, lambda: worker.frames)
+    settle(qapp, worker)
+    assert worker.renderer.rendered == [10, 20]
+    assert worker.frames == [20]
+
+
+def test_failures_reach_the_gui_thread(qapp, worker):
+    failures = []
+    worker.failed.connect(lambda message: failures.append((message, threading.current_thread())))
+    worker.renderer.gate.set()
+    worker.request({})  # No 'size', so the renderer raises
+
+    wait_for(qapp, lambda: failures)
+    assert 'KeyError' in failures[0][0]
+    assert failures[0][1] is threading.main_thread()
+    assert worker.frames == []
@@ -0,0 +1,70 @@
+from crossgen import ReticleRenderer
+
+SETTINGS = {'shape': 'Crosshair', 'size': 24, 'color': '#00FF00', 'opacity': 80, 'monitor_index': 0}
+
+
+def test_main_settings_are_the_only_layer_by_default():
+    assert ReticleRenderer.layer_specs(SETTINGS) == [
+        {'shape': 'Crosshair', 'size': 24, 'color': '#00FF00', 'opacity': 80}]
+
+
+def test_layers_inherit_omitted_keys_and_sit_below_main():
+    settings = dict(SETTINGS, layers=[{'shape': 'Circle', 'size': 40}, {'color': '#FF0000', 'opacity': 30}])
+    circle, tinted, main = ReticleRenderer.layer_specs(settings)
+    assert circle == {'shape': 'Circle', 'size': 40, 'color': '#00FF00', 'opacity': 80}
+    assert tinted == {'shape': 'Crosshair', 'size': 24, 'color': '#FF0000', 'opacity': 30}
+    assert main == {'shape': 'Crosshair', 'size': 24, 'color': '#00FF00', 'opacity': 80}
+
+
+def test_layers_do_not_leak_into_each_other():
+    settings = dict(SETTINGS, layers=[{'opacity': 10}, {}])
+    first, second, main = ReticleRenderer.layer_specs(settings)
+    assert first['opacity'] == 10
+    assert second['opacity'] == main['opacity'] == 80
+    assert 'layers' not in main and 'monitor_index' not in main
+
+
+class CountingRenderer(ReticleRenderer):
+    def __init__(self):
+        super().__init__()
+        self.rendered = []
+
+    def render_layer(self, spec, dpr=1.0):
+        self.rendered.append(spec['shape'])
+        return super().render_layer(spec, dpr)
+
+
+def test_render_reuses_unchanged_layers(qapp):
+    renderer = CountingRenderer()
+    settings = dict(SETTINGS, layers=[{'shape': 'Circle', 'size': 40}])
+    renderer.render(settings)
+    assert renderer.rendered == ['Circle', 'Crosshair']
+
+    renderer.rendered.clear()
+    renderer.render(dict(settings, color='#0000FF'))
+    assert renderer.rendered == ['Circle', 'Crosshair']  # Both layers inherit the color
+
+    renderer.rendered.clear()
+    renderer.render(dict(settings, color='#0000FF', layers=[{'shape': 'Circle', 'size': 40, 'color': '#00FF00'}]))
+    assert renderer.rendered == ['Circle']  # The main layer is unchanged
+
+    renderer.rendered.clear()
+    renderer.render(dict(settings, color='#0000FF', layers=[{'shape': 'Circle', 'size': 40, 'color': '#00FF00'}]))
+    assert renderer.rendered == []
+
+
+def test_render_re_renders_at_a_new_dpr(qapp):
+    renderer = CountingRenderer()
+    renderer.render(SETTINGS, 1.0)
+    renderer.rendered.clear()
+    sprite = renderer.render(SETTINGS, 2.0)
+    assert renderer.rendered == ['Crosshair']
+    assert sprite.devicePixelRatio() == 2.0
+
+
+def test_composite_matches_a_fresh_render(qapp):
+    settings = dict(SETTINGS, layers=[{'shape': 'Circle', 'size': 40}])
+    renderer = CountingRenderer()
+    renderer.render(dict(settings, size=30))
+    incremental = renderer.render(settings)
+    assert incremental == ReticleRenderer().render(settings)
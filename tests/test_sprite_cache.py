@@ -0,0 +1,178 @@
+import os
+import struct
+import zlib
+
+import pytest
+from PyQt5 import QtGui, sip
+from PyQt5.QtCore import Qt
+
+from crossgen import SpriteCache
+
+SETTINGS = {'shape': 'Crosshair', 'size': 24, 'color': '#00FF00'}
+
+
+def make_sprite(color='#FF0000', dpr=1.0, size=8):
+    sprite = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+    sprite.fill(QtGui.QColor(color))
+    sprite.setDevicePixelRatio(dpr)
+    return sprite
+
+
+@pytest.fixture
+def cache(qapp, tmp_path):
+    return SpriteCache(str(tmp_path))
+
+
+def entry_size(size=8):
+    return size * size * 4 + SpriteCache.TRAILER.size
+
+
+def test_round_trip_keeps_pixels_and_dpr(cache):
+    cache.store(SETTINGS, 2.0, make_sprite(dpr=2.0))
+    sprite = cache.load(SETTINGS, 2.0)
+    assert sprite is not None
+    assert (sprite.width(), sprite.height()) == (8, 8)
+    assert sprite.devicePixelRatio() == 2.0
+    assert sprite.pixelColor(4, 4).name() == '#ff0000'
+
+
+def test_other_dpr_or_settings_miss(cache):
+    cache.store(SETTINGS, 2.0, make_sprite(dpr=2.0))
+    assert cache.load(SETTINGS, 1.0) is None
+    assert cache.load(dict(SETTINGS, size=32), 2.0) is None
+
+
+def test_key_depends_only_on_drawn_specs():
+    reordered = dict(reversed(list(SETTINGS.items())))
+    assert SpriteCache.key(SETTINGS, 1.0) == SpriteCache.key(reordered, 1.0)
+    assert SpriteCache.key(SETTINGS, 1.0) == SpriteCache.key(dict(SETTINGS, markers=[{'x': 1, 'y': 2}]), 1.0)
+    assert SpriteCache.key(SETTINGS, 1.0) != SpriteCache.key(SETTINGS, 1.5)
+    assert SpriteCache.key(SETTINGS, 1.0) != SpriteCache.key(dict(SETTINGS, color='#0000FF'), 1.0)
+
+
+def test_loaded_sprite_outlives_its_file(cache):
+    cache.store(SETTINGS, 1.0, make_sprite())
+    sprite = cache.load(SETTINGS, 1.0)
+    cache.clear()
+    assert sprite.pixelColor(0, 0).name() == '#ff0000'
+
+
+def test_corrupt_pixels_are_discarded(cache):
+    cache.store(SETTINGS, 1.0, make_sprite())
+    path = cache.path(SpriteCache.key(SETTINGS, 1.0))
+    with open(path, 'r+b') as f:
+        f.write(b'\x00\x01\x02\x03')
+    assert cache.load(SETTINGS, 1.0) is None
+    assert not os.path.exists(path)
+
+
+FIELDS = ('magic', 'width', 'height', 'bytes_per_line', 'format', 'dpr')
+
+
+def rewrite_trailer(path, resign, **fields):
+    """Changes trailer fields, recomputing the CRC when resign is set"""
+    with open(path, 'r+b') as f:
+        data = f.read()
+        pixels = data[:-SpriteCache.TRAILER.size]
+        values = dict(zip(FIELDS, SpriteCache.TRAILER.unpack(data[-SpriteCache.TRAILER.size:])), **fields)
+        crc = SpriteCache.TRAILER.unpack(data[-SpriteCache.TRAILER.size:])[-1]
+        header = SpriteCache.TRAILER.pack(*(values[field] for field in FIELDS), 0)[:-4]
+        if resign:
+            crc = zlib.crc32(header, zlib.crc32(pixels))
+        f.seek(len(pixels))
+        f.write(header + struct.pack('<I', crc))
+
+
+@pytest.mark.parametrize('fields, resign', [
+    ({'magic': b'XXXX'}, False),
+    ({'width': 4}, False),
+    ({'format': int(QtGui.QImage.Format_Mono)}, False),
+    ({'dpr': 37.0}, False),
+    ({'format': int(QtGui.QImage.Format_Mono)}, True),
+    ({'format': int(QtGui.QImage.Format_RGB32)}, True),
+    ({'dpr': 0.0}, True),
+    ({'dpr': -2.0}, True),
+    ({'dpr': float('nan')}, True),
+])
+def test_bad_trailer_is_discarded(cache, fields, resign):
+    cache.store(SETTINGS, 1.0, make_sprite())
+    path = cache.path(SpriteCache.key(SETTINGS, 1.0))
+    rewrite_trailer(path, resign, **fields)
+    assert cache.load(SETTINGS, 1.0) is None
+    assert not os.path.exists(path)
+
+
+def test_resigned_trailer_still_loads(cache):
+    cache.store(SETTINGS, 1.0, make_sprite())
+    rewrite_trailer(cache.path(SpriteCache.key(SETTINGS, 1.0)), True)
+    assert cache.load(SETTINGS, 1.0) is not None
+
+
+@pytest.mark.parametrize('keep', [0, 10, entry_size() - 1])
+def test_truncated_files_miss(cache, keep):
+    cache.store(SETTINGS, 1.0, make_sprite())
+    path = cache.path(SpriteCache.key(SETTINGS, 1.0))
+    with open(path, 'r+b') as f:
+        f.truncate(keep)
+    assert cache.load(SETTINGS, 1.0) is None
+
+
+def test_eviction_drops_least_recently_used(qapp, tmp_path):
+    cache = SpriteCache(str(tmp_path), max_bytes=2 * entry_size())
+    first, second, third = (dict(SETTINGS, size=size) for size in (10, 20, 30))
+    cache.store(first, 1.0, make_sprite())
+    cache.store(second, 1.0, make_sprite())
+    os.utime(cache.path(SpriteCache.key(first, 1.0)), (1000, 1000))
+    os.utime(cache.path(SpriteCache.key(second, 1.0)), (2000, 2000))
+    assert cache.load(first, 1.0) is not None  # Loading marks it as recently used
+
+    cache.store(third, 1.0, make_sprite())
+    assert cache.load(second, 1.0) is None
+    assert cache.load(first, 1.0) is not None
+    assert cache.load(third, 1.0) is not None
+
+
+def test_clear_removes_every_entry(cache):
+    cache.store(SETTINGS, 1.0, make_sprite())
+    cache.store(dict(SETTINGS, size=32), 1.0, make_sprite())
+    cache.clear()
+    assert cache.load(SETTINGS, 1.0) is None
+    assert os.listdir(cache.cache_dir) == []
+
+
+def test_pinned_entry_survives_eviction_until_released(qapp, tmp_path):
+    cache = SpriteCache(str(tmp_path), max_bytes=entry_size())
+    cache.store(SETTINGS, 1.0, make_sprite())
+    sprite = cache.load(SETTINGS, 1.0, pin=True)
+    key = SpriteCache.key(SETTINGS, 1.0)
+
+    cache.store(dict(SETTINGS, size=32), 1.0, make_sprite())
+    assert os.path.exists(cache.path(key))
+    assert sprite.pixelColor(0, 0) == QtGui.QColor(Qt.red)
+
+    cache.release(key)
+    cache.store(dict(SETTINGS, size=40), 1.0, make_sprite())
+    assert not os.path.exists(cache.path(key))
+
+
+def test_clear_stops_serving_pinned_entries(cache):
+    cache.store(SETTINGS, 1.0, make_sprite())
+    key = SpriteCache.key(SETTINGS, 1.0)
+    cache.load(SETTINGS, 1.0, pin=True)
+    cache.clear()
+    assert cache.load(SETTINGS, 1.0) is None
+    assert cache.load(SETTINGS, 1.0, pin=True) is None
+
+    cache.release(key)
+    assert os.listdir(cache.cache_dir) == []
+
+
+@pytest.mark.parametrize('dpr', [1.0, 2.0])
+def test_pinned_sprite_reads_the_mapping(cache, dpr):
+    cache.store(SETTINGS, dpr, make_sprite(dpr=dpr))
+    sprite = cache.load(SETTINGS, dpr, pin=True)
+    key = SpriteCache.key(SETTINGS, dpr)
+    mapping = cache._pinned[key][0]
+    assert int(sprite.constBits()) == int(sip.voidptr(mapping))
+    assert sprite.pixelColor(4, 4).name() == '#ff0000'
+    cache.release(key)